@@ -1,3 +1,4 @@
+import math
 from collections.abc import Callable
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -53,14 +54,14 @@ def split_antimeridian(poly: Polygon) -> list[Polygon]:
     """Check if the provided polygon crosses the antimeridian and split it if it does."""
     x_min, _, x_max, _ = poly.bounds
 
-    # Check anitmeridian crossing
-    if (x_max - x_min > 180.0) or (x_min <= 180.0 <= x_max):
+    # Check anitmeridian crossing; polygons entirely within [-180, 180] are returned as-is
+    if (x_max - x_min > 180.0) or x_max > 180.0 or x_min < -180.0:
         dateline = shapely.wkt.loads('LINESTRING( 180.0 -90.0, 180.0 90.0)')
 
         # build new polygon with all longitudes between 0 and 360
-        x, y = poly.exterior.coords.xy
-        new_x = (k + (k <= 0.0) * 360 for k in x)
-        new_ring = LinearRing(zip(new_x, y))
+        x, y = np.asarray(poly.exterior.coords.xy)
+        new_x = x + (x <= 0.0) * 360
+        new_ring = LinearRing(np.column_stack([new_x, y]))
 
         # Split input polygon
         # (https://gis.stackexchange.com/questions/232771/splitting-polygon-by-linestring-in-geodjango_)
@@ -74,7 +75,7 @@ def split_antimeridian(poly: Polygon) -> list[Polygon]:
         for polygon_count in range(len(polys)):
             x, y = polys[polygon_count].exterior.coords.xy
             # if there are no longitude values above 180, continue
-            if not any([k > 180 for k in x]):
+            if not any(k > 180 for k in x):
                 continue
 
             # otherwise, wrap longitude values down by 360 degrees
@@ -92,30 +93,28 @@ def snap_coord(val: float, snap: float, offset: float, round_func: Callable) ->
     return round_func(float(val - offset) / snap) * snap + offset
 
 
-def translate_dem(vrt_filename: str, output_path: str, bounds: tuple[float, float, float, float]) -> None:
+def translate_dem(dem_ds: gdal.Dataset, output_path: str, bounds: tuple[float, float, float, float]) -> None:
     """Write a local subset of the OPERA DEM for a region matching the provided bounds.
 
     Params:
-        vrt_filename: Path to the input VRT file
+        dem_ds: Open GDAL dataset of the input DEM VRT
         output_path: Path to the translated output GTiff file
         bounds: Bounding box in the form of (lon_min, lat_min, lon_max, lat_max)
     """
-    ds = gdal.Open(vrt_filename, gdal.GA_ReadOnly)
-
     # update cropping coordinates to not exceed the input DEM bounding box
-    input_x_min, xres, _, input_y_max, _, yres = ds.GetGeoTransform()
-    length = ds.GetRasterBand(1).YSize
-    width = ds.GetRasterBand(1).XSize
+    input_x_min, xres, _, input_y_max, _, yres = dem_ds.GetGeoTransform()
+    length = dem_ds.GetRasterBand(1).YSize
+    width = dem_ds.GetRasterBand(1).XSize
 
     # Snap edge coordinates using the DEM pixel spacing
     # (xres and yres) and starting coordinates (input_x_min and
-    # input_x_max). Maximum values are rounded using np.ceil
-    # and minimum values are rounded using np.floor
+    # input_x_max). Maximum values are rounded using math.ceil
+    # and minimum values are rounded using math.floor
     x_min, y_min, x_max, y_max = bounds
-    snapped_x_min = snap_coord(x_min, xres, input_x_min, np.floor)
-    snapped_x_max = snap_coord(x_max, xres, input_x_min, np.ceil)
-    snapped_y_min = snap_coord(y_min, yres, input_y_max, np.floor)
-    snapped_y_max = snap_coord(y_max, yres, input_y_max, np.ceil)
+    snapped_x_min = snap_coord(x_min, xres, input_x_min, math.floor)
+    snapped_x_max = snap_coord(x_max, xres, input_x_min, math.ceil)
+    snapped_y_min = snap_coord(y_min, yres, input_y_max, math.floor)
+    snapped_y_max = snap_coord(y_max, yres, input_y_max, math.ceil)
 
     input_y_min = input_y_max + length * yres
     input_x_max = input_x_min + width * xres
@@ -125,15 +124,14 @@ def translate_dem(vrt_filename: str, output_path: str, bounds: tuple[float, floa
     adjusted_y_min = max(snapped_y_min, input_y_min)
     adjusted_y_max = min(snapped_y_max, input_y_max)
 
-    try:
-        gdal.Translate(
-            output_path, ds, format='GTiff', projWin=[adjusted_x_min, adjusted_y_max, adjusted_x_max, adjusted_y_min]
-        )
-    except RuntimeError as err:
-        if 'negative width and/or height' in str(err):
-            gdal.Translate(output_path, ds, format='GTiff', projWin=[x_min, y_max, x_max, y_min])
-        else:
-            raise
+    # Fall back to the unsnapped bounds when snapping collapses the window to a
+    # negative (or empty) width or height, rather than letting GDAL raise on it
+    if adjusted_x_min < adjusted_x_max and adjusted_y_min < adjusted_y_max:
+        proj_win = [adjusted_x_min, adjusted_y_max, adjusted_x_max, adjusted_y_min]
+    else:
+        proj_win = [x_min, y_max, x_max, y_min]
+
+    gdal.Translate(output_path, dem_ds, format='GTiff', projWin=proj_win)
 
     # stage_dem.py takes a bbox as an input. The longitude coordinates
     # of this bbox are unwrapped i.e., range in [0, 360] deg. If the
@@ -144,14 +142,14 @@ def translate_dem(vrt_filename: str, output_path: str, bounds: tuple[float, floa
     # tile is < 180 deg i.e., there is a dateline crossing.
     # This ensures that the mosaicked DEM VRT will span a min
     # range of longitudes rather than the full [-180, 180] deg
-    sr = osr.SpatialReference(ds.GetProjection())
+    sr = osr.SpatialReference(dem_ds.GetProjection())
     epsg_str = sr.GetAttrValue('AUTHORITY', 1)
 
     if x_min <= -180.0 and epsg_str == '4326':
-        ds = gdal.Open(output_path, gdal.GA_Update)
-        geotransform = list(ds.GetGeoTransform())
+        output_ds = gdal.Open(output_path, gdal.GA_Update)
+        geotransform = list(output_ds.GetGeoTransform())
         geotransform[0] += 360.0
-        ds.SetGeoTransform(tuple(geotransform))
+        output_ds.SetGeoTransform(tuple(geotransform))
 
 
 def download_opera_dem_for_footprint(outfile: Path, bounds: tuple[float, float, float, float]) -> None:
@@ -172,9 +170,11 @@ def download_opera_dem_for_footprint(outfile: Path, bounds: tuple[float, float,
             GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR',
         ):
             vrt_filename = '/vsicurl/https://nisar.asf.earthdatacloud.nasa.gov/STATIC/DEM/v1.1/EPSG4326/EPSG4326.vrt'
+            # open the remote VRT once rather than once per antimeridian split
+            dem_ds = gdal.Open(vrt_filename, gdal.GA_ReadOnly)
             for idx, poly in enumerate(polys):
                 output_path = str(outfile.parent / f'{outfile.stem}_{idx}.tif')
                 dem_list.append(output_path)
-                translate_dem(vrt_filename, output_path, poly.bounds)
+                translate_dem(dem_ds, output_path, poly.bounds)
 
             gdal.BuildVRT(str(outfile), dem_list)
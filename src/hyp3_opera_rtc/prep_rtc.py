@@ -2,21 +2,37 @@ import argparse
 import os
 import shutil
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from zipfile import ZipFile
 
 import hyp3lib.fetch
 import lxml.etree as ET
+import numpy as np
 import requests
 from hyp3lib.fetch import download_file
 from hyp3lib.scene import get_download_url
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from hyp3_opera_rtc import dem, orbit
 
 
 CMR_URL = 'https://cmr.earthdata.nasa.gov/search/granules.umm_json'
 
+# reuse one keep-alive connection pool for all CMR queries and retry transient failures
+CMR_SESSION = requests.Session()
+CMR_SESSION.mount(
+    'https://',
+    HTTPAdapter(
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+    ),
+)
+
+# templates ship with the package and never change at runtime, so compile them once and skip reload checks
+TEMPLATE_ENV = Environment(loader=FileSystemLoader(Path(__file__).parent / 'templates'), auto_reload=False)
+
 
 def prep_burst_db(save_dir: Path) -> Path:
     db_filename = 'burst_db_0.2.0_230831-bbox-only.sqlite'
@@ -33,32 +49,30 @@ def bounding_box_from_slc_granule(safe_file_path: Path) -> tuple[float, float, f
         with myzip.open(f'{safe_file_name}.SAFE/manifest.safe', 'r') as infile:
             manifest_tree = ET.parse(infile)
 
-    coordinates_elem = manifest_tree.xpath('.//*[local-name()="coordinates"]')
+    coordinates_elem = manifest_tree.find('.//{http://www.opengis.net/gml}coordinates')
     if coordinates_elem is None:
         raise RuntimeError(
             'Could not find gml:coordinates element within the manifest.safe '
             'of the provided SAFE archive, cannot determine DEM bounding box.'
         )
 
-    assert isinstance(coordinates_elem, list)
-    assert isinstance(coordinates_elem[0], ET._Element)
-    coordinates_str = coordinates_elem[0].text
+    coordinates_str = coordinates_elem.text
     assert isinstance(coordinates_str, str)
-    coordinates = coordinates_str.split()
-    lats = [float(coordinate.split(',')[0]) for coordinate in coordinates]
-    lons = [float(coordinate.split(',')[-1]) for coordinate in coordinates]
+    # coordinates are space-separated "lat,lon" pairs
+    coordinates = np.array(coordinates_str.replace(',', ' ').split(), dtype=float).reshape(-1, 2)
+    lats, lons = coordinates[:, 0], coordinates[:, 1]
 
-    lat_min = min(lats)
-    lat_max = max(lats)
-    lon_min = min(lons)
-    lon_max = max(lons)
+    lat_min = float(lats.min())
+    lat_max = float(lats.max())
+    lon_min = float(lons.min())
+    lon_max = float(lons.max())
 
     # Check if the bbox crosses the antimeridian and "unwrap" the coordinates
     # so that any resultant DEM is split properly by check_dateline
     if lon_max - lon_min > 180:
-        lons = [lon + 360 if lon < 0 else lon for lon in lons]
-        lon_min = min(lons)
-        lon_max = max(lons)
+        lons = np.where(lons < 0, lons + 360, lons)
+        lon_min = float(lons.min())
+        lon_max = float(lons.max())
 
     return (lon_min, lat_min, lon_max, lat_max)  # WSEN order
 
@@ -112,7 +126,7 @@ def validate_slc(granule: str) -> str:
 
 
 def query_cmr(params: tuple) -> dict:
-    response = requests.get(CMR_URL, params=params)
+    response = CMR_SESSION.get(CMR_URL, params=params, timeout=(5, 30))
     response.raise_for_status()
     return response.json()
 
@@ -124,14 +138,10 @@ def get_cross_pol_name(granule: str) -> str:
 
 
 def render_template(params: dict, work_dir: Path) -> None:
-    template_dir = Path(__file__).parent / 'templates'
-    with (template_dir / 'pge.yml.j2').open() as file:
-        template = Template(file.read())
-        template_str = template.render(params)
+    template = TEMPLATE_ENV.get_template('pge.yml.j2')
 
     config_path = work_dir / 'runconfig.yml'
-    with config_path.open('w') as file:
-        file.write(template_str)
+    template.stream(params).dump(str(config_path))
 
 
 def prep_rtc(
@@ -160,21 +170,26 @@ def prep_rtc(
         validate_slc(co_pol_granule)
         source_slc, opera_burst_id = co_pol_granule, None
 
-    safe_path = download_file(get_download_url(source_slc), directory=str(input_dir), chunk_size=10485760)
-    safe_path = Path(safe_path)
-    dual_pol = safe_path.name[14] == 'D'
-    print(f'Created archive: {safe_path}')
+    # the orbit download and burst DB copy only need the scene name, so overlap them with the SAFE and DEM downloads
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        orbit_future = executor.submit(orbit.get_orbit, source_slc, save_dir=input_dir)
+        db_future = executor.submit(prep_burst_db, input_dir)
+
+        safe_path = download_file(get_download_url(source_slc), directory=str(input_dir), chunk_size=10485760)
+        safe_path = Path(safe_path)
+        dual_pol = safe_path.name[14] == 'D'
+        print(f'Created archive: {safe_path}')
 
-    orbit_path = orbit.get_orbit(safe_path.with_suffix('').name, save_dir=input_dir)
-    print(f'Downloaded orbit file: {orbit_path}')
+        dem_path = input_dir / 'dem.tif'
+        granule_bbox = bounding_box_from_slc_granule(safe_path)
+        dem.download_opera_dem_for_footprint(dem_path, granule_bbox)
+        print(f'Downloaded DEM: {dem_path}')
 
-    db_path = prep_burst_db(input_dir)
-    print(f'Burst database: {db_path}')
+        orbit_path = orbit_future.result()
+        print(f'Downloaded orbit file: {orbit_path}')
 
-    dem_path = input_dir / 'dem.tif'
-    granule_bbox = bounding_box_from_slc_granule(safe_path)
-    dem.download_opera_dem_for_footprint(dem_path, granule_bbox)
-    print(f'Downloaded DEM: {dem_path}')
+        db_path = db_future.result()
+        print(f'Burst database: {db_path}')
 
     runconfig_dict = {
         'granule_path': str(safe_path),
@@ -1,7 +1,7 @@
 import argparse
 from pathlib import Path
-from shutil import copyfile, make_archive
 from xml.etree import ElementTree as et
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from hyp3lib import aws
 
@@ -33,21 +33,20 @@ def upload_rtc(bucket: str, bucket_prefix: str, output_dir: Path) -> None:
 
 def make_zip(output_files: list[Path], output_dir: Path) -> Path:
     zip_name = make_zip_name(output_files)
-    zip_path = output_dir / zip_name
-
-    zip_archive_path = output_dir / 'zip'
-    (zip_archive_path / zip_name).mkdir(exist_ok=True, parents=True)
+    zip_path = output_dir / f'{zip_name}.zip'
 
     file_extensions_to_include = set(['.png', '.xml', '.tif', '.h5'])
-    for output_file in output_files:
-        if output_file.suffix not in file_extensions_to_include:
-            continue
+    with ZipFile(zip_path, 'w', compression=ZIP_DEFLATED) as output_zip:
+        output_zip.writestr(f'{zip_name}/', '')
+        for output_file in output_files:
+            if output_file.suffix not in file_extensions_to_include:
+                continue
 
-        zip_dest_path = zip_archive_path / zip_name / output_file.name
-        copyfile(output_file, zip_dest_path)
+            # COG, HDF5 and PNG outputs are already compressed, so only deflate the XML metadata
+            compress_type = ZIP_DEFLATED if output_file.suffix == '.xml' else ZIP_STORED
+            output_zip.write(output_file, arcname=f'{zip_name}/{output_file.name}', compress_type=compress_type)
 
-    output_zip = make_archive(base_name=str(zip_path), format='zip', root_dir=zip_archive_path)
-    return Path(output_zip)
+    return zip_path
 
 
 def make_zip_name(product_files: list[Path]) -> str:
@@ -40,3 +40,14 @@ def test_check_antimeridian():
     assert len(polys) == 2
     assert polys[0].equals(negative_side)
     assert polys[1].equals(positive_side)
+
+    west_of_antimeridian = box(-181, -1, -179, 0)
+    polys = dem.split_antimeridian(west_of_antimeridian)
+    assert len(polys) == 2
+    assert polys[0].equals(box(-180, -1, -179, 0))
+    assert polys[1].equals(box(179, -1, 180, 0))
+
+    east_edge = box(179, -1, 180, 0)
+    polys = dem.split_antimeridian(east_edge)
+    assert len(polys) == 1
+    assert polys[0].equals(east_edge)
@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from zipfile import ZipFile
 
 import pytest
 import requests
@@ -92,3 +93,52 @@ def test_get_cross_pol_name():
 def test_get_granule_params():
     prep_rtc.get_burst_params('S1_146160_IW1_20241029T095958_VV_592B-BURST')
     prep_rtc.validate_slc('S1A_IW_SLC__1SDV_20250704T124517_20250704T124544_059934_0771EA_C208')
+
+
+def test_render_template(tmp_path):
+    params = {
+        'granule_path': '/input_dir/granule.zip',
+        'orbit_path': '/input_dir/orbit.EOF',
+        'db_path': '/input_dir/db.sqlite',
+        'dem_path': '/input_dir/dem.tif',
+        'scratch_dir': '/scratch_dir',
+        'output_dir': '/output_dir',
+        'dual_pol': True,
+        'resolution': 30,
+        'num_workers': 0,
+        'data_validity_start_date': '20140403',
+        'opera_burst_id': 't035_073251_iw2',
+    }
+    prep_rtc.render_template(params, tmp_path)
+    prep_rtc.render_template(params, tmp_path)
+
+    runconfig = (tmp_path / 'runconfig.yml').read_text()
+    assert '- t035_073251_iw2' in runconfig
+    assert 'polarization: dual-pol' in runconfig
+    assert 'output_dir: /output_dir' in runconfig
+    assert prep_rtc.TEMPLATE_ENV.get_template('pge.yml.j2') is prep_rtc.TEMPLATE_ENV.get_template('pge.yml.j2')
+
+
+def test_bounding_box_from_slc_granule(tmp_path):
+    def make_safe(name, coordinates):
+        safe_path = tmp_path / f'{name}.zip'
+        manifest = (
+            '<xfdu:XFDU xmlns:xfdu="urn:ccsds:schema:xfdu:1" xmlns:gml="http://www.opengis.net/gml">'
+            f'<metadataSection><gml:coordinates>{coordinates}</gml:coordinates></metadataSection>'
+            '</xfdu:XFDU>'
+        )
+        with ZipFile(safe_path, 'w') as safe_zip:
+            safe_zip.writestr(f'{name}.SAFE/manifest.safe', manifest)
+        return safe_path
+
+    safe_path = make_safe('granule', '36.1,-117.9 36.5,-115.1 34.9,-114.8 34.5,-117.5')
+    assert prep_rtc.bounding_box_from_slc_granule(safe_path) == (-117.9, 34.5, -114.8, 36.5)
+
+    safe_path = make_safe('antimeridian', '-16.1,179.2 -15.7,-178.4 -17.4,-178.1 -17.8,179.5')
+    assert prep_rtc.bounding_box_from_slc_granule(safe_path) == (179.2, -17.8, 181.9, -15.7)
+
+    safe_path = tmp_path / 'missing.zip'
+    with ZipFile(safe_path, 'w') as safe_zip:
+        safe_zip.writestr('missing.SAFE/manifest.safe', '<xfdu:XFDU xmlns:xfdu="urn:ccsds:schema:xfdu:1"/>')
+    with pytest.raises(RuntimeError, match='gml:coordinates'):
+        prep_rtc.bounding_box_from_slc_granule(safe_path)
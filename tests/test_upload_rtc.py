@@ -3,7 +3,7 @@ import shutil
 from collections import Counter
 from pathlib import Path
 from unittest.mock import call, patch
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pytest
 from hyp3lib import aws
@@ -73,6 +73,18 @@ def test_upload_slc_rtc_with_existing_objects(rtc_slc_results_dir, s3_bucket):
     assert file_suffixes == {'.json': 1, '.log': 1, '.h5': 27, '.xml': 27, '.png': 27, '.tif': 27 * 3}
 
 
+def test_make_zip(rtc_burst_results_dir):
+    output_files = [f for f in rtc_burst_results_dir.iterdir() if not f.is_dir()]
+    zip_path = upload_rtc.make_zip(output_files, rtc_burst_results_dir)
+
+    assert zip_path == rtc_burst_results_dir / (upload_rtc.make_zip_name(output_files) + '.zip')
+
+    with ZipFile(zip_path) as zf:
+        compress_types = {Path(f.filename).suffix: f.compress_type for f in zf.infolist() if not f.is_dir()}
+
+    assert compress_types == {'.xml': ZIP_DEFLATED, '.h5': ZIP_STORED, '.png': ZIP_STORED, '.tif': ZIP_STORED}
+
+
 def test_make_zip_name(rtc_burst_output_files):
     zip_filename = upload_rtc.make_zip_name([Path(f) for f in rtc_burst_output_files])
 